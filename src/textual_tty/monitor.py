@@ -13,9 +13,12 @@ drives the board from the widget's layout size.)
 
 from __future__ import annotations
 
+import codecs
 import webbrowser
+from collections.abc import Iterable, Iterator
 
 from bittty import Board
+from bittty.style import Style
 from bittty.terminals import Terminal as Chrome
 from rich.segment import Segment
 from rich.style import Style as RichStyle
@@ -42,6 +45,23 @@ _POINTER_SHAPES = {
     "left_ptr": "default",
 }
 
+# A space in the default style renders exactly like the strip's padding.
+_BLANK_STYLE = Style()
+
+
+def _row_spans(rows: Iterable[int]) -> Iterator[tuple[int, int]]:
+    """Coalesce row numbers into (top, height) runs of adjacent rows."""
+    top = end = None
+    for y in sorted(rows):
+        if y == end:
+            end += 1
+            continue
+        if top is not None:
+            yield top, end - top
+        top, end = y, y + 1
+    if top is not None:
+        yield top, end - top
+
 
 class MonitorChrome(Chrome):
     """The board-facing jack for a display-only view: render hooks only."""
@@ -99,6 +119,7 @@ class Monitor(Widget):
         self._cursor_phase = True  # blink: False hides the cursor for half a period
         self._board_size = (self.board.width, self.board.height)  # re-layout when the board resizes
         self._base_pointer = "default"  # the OSC 22 shape; link hover overrides it transiently
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")  # holds split code points
 
     # --- lifecycle --- #
 
@@ -117,6 +138,22 @@ class Monitor(Widget):
         self.board.parser.feed(data)
         self._dirty = True
 
+    def feed_bytes(self, data: bytes | bytearray | memoryview, final: bool = False) -> None:
+        """Feed raw output (a recording, a socket) without decoding it first.
+
+        Pass whole reads — 4 KB or more — rather than dribbling bytes: each
+        call is one parser pass. A UTF-8 sequence split across calls is held
+        back until its tail arrives. Pass `final=True` (data may be empty) when
+        the source ends, as the board's own PTY reader does at EOF: a dangling
+        partial sequence comes out as U+FFFD and the decoder starts clean for
+        the next source.
+        """
+        text = self._decoder.decode(data, final=final)
+        if final:
+            self._decoder.reset()
+        if text:
+            self.feed(text)
+
     def set_sync_output(self, enabled: bool) -> None:
         """Mode 2026: hold repaints while the source composes a frame."""
         self._sync = enabled
@@ -170,8 +207,10 @@ class Monitor(Widget):
         if len(rows) >= self.size.height:
             self.refresh()
         else:
+            # One region per run of adjacent rows: a region scroll or a block of
+            # output is a single rectangle to the compositor, not one per row.
             width = self.size.width
-            self.refresh(*(Region(0, y, width, 1) for y in rows))
+            self.refresh(*(Region(0, top, width, height) for top, height in _row_spans(rows)))
 
     # --- sizing: board -> widget --- #
 
@@ -222,21 +261,37 @@ class Monitor(Widget):
             cursor_x = self.board.cursor.x
 
         segments = []
-        run: list[str] = []
+        run: list[str] = []  # one buffer per line, cleared between style runs
         run_style = None
         row = page.grid[y]
-        for x, (style, char) in enumerate(row[:width]):
+        # Stop at the last inked cell (or the cursor): trailing blanks are left to
+        # the padding. A run of spaces shares one style object, whether bittty's
+        # blank cell or a written run, so after the first comparison the scan is
+        # an identity check.
+        end = min(width, len(row))
+        stop = cursor_x + 1
+        blank_style = None
+        while end > stop:
+            style, char = row[end - 1]
+            if char != " ":
+                break
+            if style is not blank_style:
+                if style != _BLANK_STYLE:
+                    break
+                blank_style = style
+            end -= 1
+        for x, (style, char) in enumerate(row[:end]):
             if x == cursor_x:
                 if run:
                     segments.append(Segment("".join(run), self._to_rich(run_style)))
-                    run = []
+                    run.clear()
                 segments.append(Segment(char, self._cursor_style(self._to_rich(style))))
                 run_style = None
                 continue
             if style is not run_style and style != run_style:
                 if run:
                     segments.append(Segment("".join(run), self._to_rich(run_style)))
-                    run = []
+                    run.clear()
                 run_style = style
             run.append(char)
         if run:
@@ -9,12 +9,17 @@ callers cache per Style and invalidate on `palette.generation`.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from bittty.style import Style
 from rich.color import Color as RichColor
 from rich.style import Style as RichStyle
 
 
+@lru_cache(maxsize=1024)
 def rich_color(rgb: tuple[int, int, int] | None) -> RichColor | None:
+    """RGB -> Rich colour, memoised: a palette change re-converts every cached
+    style, but the 256 indexed colours and a session's truecolours repeat."""
     return None if rgb is None else RichColor.from_rgb(*rgb)
 
 
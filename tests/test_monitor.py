@@ -5,6 +5,7 @@ from __future__ import annotations
 from textual.app import App, ComposeResult
 
 from textual_tty import Monitor
+from textual_tty.monitor import _row_spans
 
 
 class MonitorApp(App):
@@ -79,3 +80,35 @@ async def test_selection_extracts_board_text():
         await pilot.mouse_up(Monitor, offset=(10, 0))
         await pilot.pause()
         assert app.screen.get_selected_text() == "hello cast"
+
+
+async def test_feed_bytes_holds_split_utf8():
+    app = MonitorApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        await pilot.pause()
+        monitor = app.query_one(Monitor)
+        encoded = "café cast".encode()
+        monitor.feed_bytes(encoded[:4])  # splits the two-byte é
+        monitor.feed_bytes(memoryview(encoded)[4:])
+        await pilot.pause(0.1)
+        assert "café cast" in monitor.render_line(0).text
+
+
+def test_dirty_rows_coalesce_into_spans():
+    assert list(_row_spans({7, 2, 3, 4, 9, 8})) == [(2, 3), (7, 3)]
+    assert list(_row_spans([5])) == [(5, 1)]
+    assert list(_row_spans([])) == []
+
+
+async def test_feed_bytes_final_flushes_a_dangling_sequence():
+    app = MonitorApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        await pilot.pause()
+        monitor = app.query_one(Monitor)
+        monitor.feed_bytes(b"end\xc3")  # the source stops mid-sequence
+        monitor.feed_bytes(b"", final=True)
+        await pilot.pause(0.1)
+        assert monitor.board.blitter.current_buffer.get_line_text(0).startswith("end�")
+
+        monitor.feed_bytes(b"\xa9", final=True)  # a fresh source: no stale lead byte
+        assert monitor.board.blitter.current_buffer.get_line_text(0).startswith("end��")
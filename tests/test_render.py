@@ -140,3 +140,21 @@ async def test_tick_repaints_only_dirty_rows():
         seen = page.observe()
         term.board.parser.feed("\x1b[5;1Hxyz")
         assert page.dirty_rows(seen) == [4]
+
+
+async def test_trailing_blanks_are_left_to_the_padding():
+    app = TerminalApp(["sleep", "60"])
+    async with app.run_test(size=(40, 10)) as pilot:
+        term = app.query_one(Terminal)
+        await pilot.pause()
+        # Cursor hidden, so the scan isn't held open at its column.
+        term.board.parser.feed("\x1b[?25lhi" + " " * 10 + "\x1b[0m  ")  # written spaces, two style runs
+        strip = term.render_line(0)
+        assert strip._segments[0].text == "hi"
+        assert strip.cell_length == term.size.width
+
+        # Coloured blanks are ink, not padding.
+        term.board.parser.feed("\r\nx\x1b[44m\x1b[K")
+        blue = term.render_line(1)._segments[1]
+        assert blue.style.bgcolor.triplet == term.board.palette.colors[4]
+        assert blue.cell_length == term.size.width - 1